@@ -1,4 +1,6 @@
+import copy
 import os
+import sys
 from typing import Any
 
 from soy_cli import logging
@@ -9,8 +11,7 @@ from soy_cli.config.env import env
 from soy_cli.utils.loaders import (
     load_class_from_module,
     load_module_from_path,
-    render_configs_with_jinja,
-    safe_load_yaml,
+    render_config_file,
 )
 from pydantic import BaseModel, Field
 
@@ -20,6 +21,52 @@ TRANSFORM_FILE = "main.py"
 
 logger = logging.getLogger(__name__)
 
+# Both caches hold one entry per absolute path, stored with the full cache key (path, modification time,
+# environment hash) it was built for, so editing a file replaces its entry instead of adding one.
+# Rendered configurations
+_CONFIG_CACHE: dict[str, tuple[tuple[str, int, int], dict]] = {}
+# Configurations validated on their first load, copied on later loads when TRUST_CONFIG is enabled
+_VALIDATED_CONFIGS: dict[str, tuple[tuple[str, int, int], "BaseAssetConfig"]] = {}
+
+
+def _config_cache_key(file_path: str, stat_result: os.stat_result | None = None) -> tuple[str, int, int]:
+    """Build the cache key identifying a configuration file in its current state.
+
+    :param str file_path: The path to the YAML configuration file.
+    :param stat_result: Optional result of an `os.stat` already made on the file, to avoid a second call.
+    :return tuple[str, int, int]: The absolute path, modification time and environment hash.
+    """
+    abs_path = os.path.abspath(file_path)
+    if stat_result is None:
+        stat_result = os.stat(abs_path)
+    return (
+        abs_path,
+        stat_result.st_mtime_ns,
+        hash(tuple(sorted(env.model_dump().items()))),
+    )
+
+
+def _load_rendered_config(cache_key: tuple[str, int, int]) -> dict:
+    """Load and render a configuration file, reusing the result while the file and environment are unchanged.
+
+    :param tuple[str, int, int] cache_key: The key returned by `_config_cache_key`.
+    :return dict: The rendered configuration.
+    """
+    cached = _CONFIG_CACHE.get(cache_key[0])
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    rendered_configs = render_config_file(cache_key[0], vars_to_render=env.model_dump())
+    _CONFIG_CACHE[cache_key[0]] = (cache_key, rendered_configs)
+    return rendered_configs
+
+
+def _copy_io_model(model: InputModel | OutputModel) -> InputModel | OutputModel:
+    """Copy a validated input or output with its own `args` and `columns`, and without loaded data."""
+    model_copy = model.model_copy(update={"args": copy.deepcopy(model.args), "columns": list(model.columns)})
+    model_copy._data = None
+    return model_copy
+
 
 class BaseAssetConfig(BaseModel):
     name: str = None
@@ -27,21 +74,49 @@ class BaseAssetConfig(BaseModel):
     outputs: list[OutputModel] = Field(default_factory=list)
     context: dict = Field(default_factory=dict)
 
-    def get_inputs_dict(self) -> dict:
-        """Get inputs as a dictionary for easier access by name."""
-        return {_input.name: _input.model_dump() for _input in self.inputs}
+    def get_inputs_dict(self) -> dict[str, InputModel]:
+        """Get inputs as a dictionary of models for easier access by name."""
+        return {_input.name: _input for _input in self.inputs}
 
-    def get_outputs_dict(self) -> dict:
-        """Get outputs as a dictionary for easier access by name."""
-        return {_output.name: _output.model_dump() for _output in self.outputs}
+    def get_outputs_dict(self) -> dict[str, OutputModel]:
+        """Get outputs as a dictionary of models for easier access by name."""
+        return {_output.name: _output for _output in self.outputs}
 
     @classmethod
-    def from_file(cls, file_path: str):
-        """Create an instance of the asset configuration from a file."""
-        configs = safe_load_yaml(file_path)
-        rendered_configs = render_configs_with_jinja(
-            configs=configs, vars_to_render=env.model_dump())
-        return cls(**rendered_configs)
+    def from_file(cls, file_path: str, stat_result: os.stat_result | None = None):
+        """Create an instance of the asset configuration from a file.
+
+        When `TRUST_CONFIG` is enabled, the configuration validated on the first load of a file
+        is kept, and later loads of the unchanged file return copies of it without re-running validation.
+
+        :param str file_path: The path to the YAML configuration file.
+        :param stat_result: Optional result of an `os.stat` already made on the file.
+        """
+        cache_key = _config_cache_key(file_path, stat_result)
+        if env.TRUST_CONFIG:
+            validated_key, validated = _VALIDATED_CONFIGS.get(cache_key[0], (None, None))
+            if validated_key == cache_key and type(validated) is cls:
+                return validated._copy_validated()
+
+        # Validate from a deep copy, pydantic only copies the top-level dicts and the nested values
+        # would otherwise be shared with the cached rendered configuration
+        config = cls(**copy.deepcopy(_load_rendered_config(cache_key)))
+        if env.TRUST_CONFIG:
+            # Keep a private copy, the returned instance is handed to the asset which mutates it
+            _VALIDATED_CONFIGS[cache_key[0]] = (cache_key, config._copy_validated())
+        return config
+
+    def _copy_validated(self):
+        """Copy a validated configuration without re-running validation.
+
+        The inputs, outputs and their mutable fields are copied too, so changes made by an asset
+        (loaded data, `args` edits) never reach the kept configuration.
+        """
+        return self.model_copy(update={
+            "inputs": [_copy_io_model(_input) for _input in self.inputs],
+            "outputs": [_copy_io_model(_output) for _output in self.outputs],
+            "context": copy.deepcopy(self.context),
+        })
 
 
 class BaseAsset:
@@ -95,12 +170,22 @@ class BaseAsset:
         """
         return self._input_manager.read(key, columns, **kwargs)
 
+    def read_inputs(self, keys: list[str], **kwargs) -> dict[str, Any]:
+        """Read several inputs concurrently.
+
+        :param keys: The input configuration keys
+        :param kwargs: Additional keyword arguments for the readers
+        :return: The loaded data of each input, keyed by input key
+        """
+        return self._input_manager.read_many(keys, **kwargs)
+
     @classmethod
     def from_file(cls, file_path):
         """Create an instance of the asset from a file."""
         config = BaseAssetConfig.from_file(file_path)
-        logger.debug("Loaded asset configuration config: {config}",
-                     config={config.model_dump_json()})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded asset configuration config: {config}",
+                         config=config.model_dump_json())
         return cls(config=config)
 
     @classmethod
@@ -110,10 +195,8 @@ class BaseAsset:
         This method automatically determines the directory where the calling class
         is defined and loads the asset configuration from io.yaml file in that directory.
         """
-        import inspect
-
         # Get the directory where the actual subclass is defined (not where start() is called)
-        asset_dir = os.path.dirname(os.path.abspath(inspect.getfile(cls)))
+        asset_dir = os.path.dirname(os.path.abspath(sys.modules[cls.__module__].__file__))
 
         logger.debug(
             "Loading asset from directory: {asset_dir}", asset_dir=asset_dir)
@@ -121,16 +204,19 @@ class BaseAsset:
         # Check for required files
         io_file = os.path.join(asset_dir, IO_FILE)
 
-        if not os.path.exists(io_file):
+        try:
+            io_file_stat = os.stat(io_file)
+        except FileNotFoundError as e:
             raise FileNotFoundError(
-                f"IO configuration file not found: {io_file}")
+                f"IO configuration file not found: {io_file}") from e
 
         # Load configuration from io.yaml
-        config = BaseAssetConfig.from_file(io_file)
+        config = BaseAssetConfig.from_file(io_file, stat_result=io_file_stat)
         config.context = {**config.context, **(context or {})}
 
-        logger.debug("Loaded asset configuration from root: {config}",
-                     config=config.model_dump_json())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded asset configuration from root: {config}",
+                         config=config.model_dump_json())
         return cls(config=config)
 
     def transform(self):
@@ -154,7 +240,7 @@ def load_asset(
             f"Main transform file '{TRANSFORM_FILE}' not found in path: {path}"
         )
 
-    module_name = path.split("/")[-1]
+    module_name = os.path.basename(os.path.normpath(path))
     asset_module = load_module_from_path(
         module_name=module_name,
         module_file_path=main_file
@@ -1,29 +1,54 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from soy_cli import logging
 
 logger = logging.getLogger(__name__)
 
 
-class InputModel(BaseModel):
-    """Represents an input for an asset."""
+def normalize_columns(columns: str | list[str] | None) -> list[str] | None:
+    """Wrap a single column name into a list, so readers and writers only ever receive lists."""
+    return [columns] if isinstance(columns, str) else columns
+
+
+class BaseIOModel(BaseModel):
+    """Fields and helpers shared by asset inputs and outputs."""
 
     name: str
     _data: Any = None
     strategy: str = "spark"
     api: str = None
-    args: dict = {}
+    args: dict = Field(default_factory=dict)
     columns: list[str] = Field(default_factory=list)
 
+    @field_validator("columns", mode="before")
+    @classmethod
+    def _normalize_columns(cls, value: Any) -> Any:
+        """Accept a single column name (or nothing) in place of a list of columns."""
+        return [] if value is None else normalize_columns(value)
+
+    def prepared_args(self, options_key: str) -> tuple[dict, dict]:
+        """Split `args` into call arguments and the options nested under `options_key`.
+
+        The split is made on every call, so changes made to `args` (in place or not) always apply.
+
+        :param options_key: The key holding the options in `args` (e.g. "options", "pandas_options").
+        :return: A tuple with the call arguments and the options.
+        """
+        call_args = dict(self.args)
+        options = call_args.pop(options_key, None) or {}
+        return call_args, options
+
+
+class InputModel(BaseIOModel):
+    """Represents an input for an asset."""
+
 
-class OutputModel(BaseModel):
+class OutputModel(BaseIOModel):
     """Represents an output for an asset."""
 
-    name: str
-    _data: Any = None
-    strategy: str = "spark"
-    api: str = None
-    args: dict = {}
-    columns: list[str] = Field(default_factory=list)
+
+# Validate whole lists of inputs/outputs in a single pydantic-core call instead of one call per item
+INPUTS_ADAPTER = TypeAdapter(list[InputModel])
+OUTPUTS_ADAPTER = TypeAdapter(list[OutputModel])
@@ -1,14 +1,47 @@
 
+import functools
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from soy_cli import logging
-from soy_cli.common.models import InputModel
-from soy_cli.common.strategies.pandas import pandas_reader
-from soy_cli.common.strategies.spark import spark_reader
+from soy_cli.common.models import INPUTS_ADAPTER, InputModel, normalize_columns
 
 logger = logging.getLogger(__name__)
 
 
+# lru_cache does not serialize its first call, so concurrent reads would each bootstrap their own
+# session (and possibly start the cluster) without these locks
+_SPARK_SESSION_LOCK = threading.Lock()
+_READ_EXECUTOR_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_spark_session() -> Any:
+    """Create the Databricks session, only ever called under `_SPARK_SESSION_LOCK`."""
+    from soy_cli.databricks.session import get_databricks_session
+    return get_databricks_session()
+
+
+def _get_spark_session() -> Any:
+    """Get the Databricks session once and reuse it for every subsequent Spark read."""
+    with _SPARK_SESSION_LOCK:
+        return _create_spark_session()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_read_executor() -> ThreadPoolExecutor:
+    """Create the shared read thread pool, only ever called under `_READ_EXECUTOR_LOCK`."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="soy-cli-reader")
+
+
+def _get_read_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by all input managers to read independent inputs concurrently."""
+    with _READ_EXECUTOR_LOCK:
+        return _create_read_executor()
+
+
 class ReaderStrategy:
     """Base class for reader strategies."""
 
@@ -25,8 +58,9 @@ class SparkReaderStrategy(ReaderStrategy):
 
     def read(self, input_config: InputModel, columns: list[str] | None = None, **kwargs) -> Any:
         """Read data using Spark reader."""
-        from soy_cli.databricks.session import get_databricks_session
-        spark_session = get_databricks_session()
+        # Imported lazily so pyspark is only loaded when a spark input is read
+        from soy_cli.common.strategies.spark import spark_reader
+        spark_session = _get_spark_session()
         return spark_reader(spark_session, input_config, columns or [], **kwargs)
 
 
@@ -35,6 +69,8 @@ class PandasReaderStrategy(ReaderStrategy):
 
     def read(self, input_config: InputModel, columns: list[str] | None = None, **kwargs) -> Any:
         """Read data using pandas reader."""
+        # Imported lazily so pandas is only loaded when a pandas input is read
+        from soy_cli.common.strategies.pandas import pandas_reader
         return pandas_reader(input_config, columns, **kwargs)
 
 
@@ -42,26 +78,37 @@ class InputManager:
     """Manager class to handle input access and automatic data loading with different strategies."""
 
     def __init__(self, inputs_config: dict):
-        self._inputs = inputs_config
-        self._strategies = {
-            'spark': SparkReaderStrategy(),
-            'pandas': PandasReaderStrategy(),
+        # Validate all inputs once up front so lookups don't re-run pydantic validation
+        self._inputs: dict[str, InputModel] = dict(zip(
+            inputs_config.keys(),
+            INPUTS_ADAPTER.validate_python(list(inputs_config.values())),
+            strict=True,
+        ))
+        self._strategy_factories: dict[str, Callable[[], ReaderStrategy]] = {
+            'spark': SparkReaderStrategy,
+            'pandas': PandasReaderStrategy,
             # Add more strategies here as needed
-            # 'api': APIReaderStrategy(),
-            # 'custom': CustomReaderStrategy(),
+            # 'api': APIReaderStrategy,
+            # 'custom': CustomReaderStrategy,
         }
+        # Strategy instances, created from their factory the first time they are used
+        self._strategies: dict[str, ReaderStrategy] = {}
+        # Reader strategy resolved for each input key, filled on first read
+        self._resolved: dict[str, ReaderStrategy] = {}
+        # Guards strategy creation and resolution, which may run from several reader threads
+        self._strategies_lock = threading.RLock()
 
     def __getitem__(self, key: str):
         """Get an input by key and automatically load data if not already loaded."""
         if key not in self._inputs:
             raise KeyError(f"Input '{key}' not found")
 
-        input_config = InputModel.model_validate(self._inputs[key])
+        input_config = self._inputs[key]
 
         strategy = input_config.strategy
         if not strategy:
             raise ValueError(
-                f"Input configuration for '{key}' does not specify a strategy. Available strategies: {list(self._strategies.keys())}"
+                f"Input configuration for '{key}' does not specify a strategy. Available strategies: {self._available_strategies()}"
             )
 
         # If data is not already loaded, load it using the appropriate strategy
@@ -69,7 +116,7 @@ class InputManager:
             try:
                 # Extract parameters for the reader
                 if input_config.api:
-                    self._load_data(key, input_config, strategy)
+                    self._load_data(key, input_config)
                 else:
                     logger.warning(
                         "No API specified for input '{key}', cannot load data", key=key)
@@ -81,17 +128,42 @@ class InputManager:
 
         return input_config
 
-    def _load_data(self, key: str, input_config: InputModel, strategy: str = 'spark', **kwargs) -> None:
-        """Load data using the specified strategy."""
-        if strategy not in self._strategies:
-            raise ValueError(
-                f"Unknown reader strategy: {strategy}. Available strategies: {list(self._strategies.keys())}")
-
-        reader_strategy = self._strategies[strategy]
+    def _available_strategies(self) -> list[str]:
+        """Return the names of all registered reader strategies."""
+        return list({**self._strategy_factories, **self._strategies}.keys())
+
+    def _get_strategy(self, name: str) -> ReaderStrategy:
+        """Return the reader strategy registered under a name, instantiating it on first use."""
+        with self._strategies_lock:
+            if name not in self._strategies:
+                if name not in self._strategy_factories:
+                    raise ValueError(
+                        f"Unknown reader strategy: {name}. Available strategies: {self._available_strategies()}")
+                self._strategies[name] = self._strategy_factories[name]()
+            return self._strategies[name]
+
+    def _resolve_strategy(self, key: str) -> ReaderStrategy:
+        """Return the reader strategy of an input, resolving it from its configuration only once per key."""
+        reader_strategy = self._resolved.get(key)
+        if reader_strategy is None:
+            with self._strategies_lock:
+                reader_strategy = self._resolved.get(key)
+                if reader_strategy is None:
+                    input_config = self._inputs[key]
+                    if not input_config.strategy:
+                        raise ValueError(
+                            f"Input configuration for '{key}' does not specify a strategy. Available strategies: {self._available_strategies()}"
+                        )
+                    reader_strategy = self._resolved[key] = self._get_strategy(input_config.strategy)
+        return reader_strategy
+
+    def _load_data(self, key: str, input_config: InputModel, **kwargs) -> None:
+        """Load data using the strategy configured for the input."""
+        reader_strategy = self._resolve_strategy(key)
 
         try:
             logger.debug(
-                "Loading data for input '{key}' using {strategy} strategy", key=key, strategy=strategy)
+                "Loading data for input '{key}' using {strategy} strategy", key=key, strategy=input_config.strategy)
             data = reader_strategy.read(
                 input_config, input_config.columns, **kwargs)
             # Update the input config with loaded data
@@ -113,19 +185,9 @@ class InputManager:
         if key not in self._inputs:
             raise KeyError(f"Input '{key}' not found")
 
-        input_config = InputModel.model_validate(self._inputs[key])
-
-        if not input_config.strategy:
-            raise ValueError(
-                f"Input configuration for '{key}' does not specify a strategy. Available strategies: {list(self._strategies.keys())}"
-            )
-
-        if input_config.strategy not in self._strategies:
-            raise ValueError(
-                f"Unknown reader strategy: {input_config.strategy}. Available strategies: {list(self._strategies.keys())}"
-            )
-
-        reader_strategy: ReaderStrategy = self._strategies[input_config.strategy]
+        reader_strategy = self._resolve_strategy(key)
+        input_config = self._inputs[key]
+        columns = normalize_columns(columns)
 
         try:
             logger.debug(
@@ -139,9 +201,42 @@ class InputManager:
             logger.info("Successfully read data for input '{key}'", key=key)
             return data
 
-    def add_strategy(self, name: str, strategy: ReaderStrategy) -> None:
-        """Add a custom reader strategy."""
-        self._strategies[name] = strategy
+    def read_many(self, keys: Iterable[str], **kwargs) -> dict[str, Any]:
+        """Read several inputs concurrently.
+
+        Reads are mostly bound by I/O latency (metastore calls, remote storage), so independent
+        inputs are submitted to a shared thread pool and their latencies overlap.
+
+        :param keys: The input configuration keys to read
+        :param kwargs: Additional keyword arguments for every reader
+        :return: The loaded data of each input, keyed by input key
+        """
+        keys = list(keys)
+        for key in keys:
+            if key not in self._inputs:
+                raise KeyError(f"Input '{key}' not found")
+
+        if len(keys) <= 1:
+            return {key: self.read(key, **kwargs) for key in keys}
+
+        # Resolve (and create) the strategies up front, so reader threads only ever look them up
+        for key in keys:
+            self._resolve_strategy(key)
+
+        executor = _get_read_executor()
+        futures = {key: executor.submit(self.read, key, **kwargs) for key in keys}
+        return {key: future.result() for key, future in futures.items()}
+
+    def add_strategy(self, name: str, strategy: ReaderStrategy | Callable[[], ReaderStrategy]) -> None:
+        """Add a custom reader strategy, given either as an instance or as a factory creating one on first use."""
+        with self._strategies_lock:
+            if isinstance(strategy, ReaderStrategy):
+                self._strategies[name] = strategy
+            else:
+                self._strategy_factories[name] = strategy
+                self._strategies.pop(name, None)
+            # Inputs may now resolve to a different strategy instance
+            self._resolved.clear()
         logger.info("Added reader strategy: {name}", name=name)
 
     def keys(self):
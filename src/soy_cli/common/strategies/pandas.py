@@ -6,6 +6,52 @@ from soy_cli.common.models import InputModel, OutputModel
 
 logger = logging.getLogger(__name__)
 
+# Map API to pandas read function
+_PANDAS_READERS = {
+    "read_csv": pd.read_csv,
+    "read_excel": pd.read_excel,
+    "read_json": pd.read_json,
+    "read_parquet": pd.read_parquet,
+    "read_feather": pd.read_feather,
+    "read_pickle": pd.read_pickle,
+    "read_hdf": pd.read_hdf,
+    "read_sql": pd.read_sql,
+    "read_table": pd.read_table,
+    # Shorter aliases for convenience
+    "csv": pd.read_csv,
+    "excel": pd.read_excel,
+    "json": pd.read_json,
+    "parquet": pd.read_parquet,
+    "feather": pd.read_feather,
+    "pickle": pd.read_pickle,
+    "hdf": pd.read_hdf,
+    "sql": pd.read_sql,
+    "table": pd.read_table
+}
+
+# Map API to the name of the pandas DataFrame write method
+_PANDAS_WRITE_METHODS = {
+    "to_csv": "to_csv",
+    "to_excel": "to_excel",
+    "to_json": "to_json",
+    "to_parquet": "to_parquet",
+    "to_feather": "to_feather",
+    "to_pickle": "to_pickle",
+    "to_hdf": "to_hdf",
+    "to_html": "to_html",
+    "to_latex": "to_latex",
+    # Shorter aliases for convenience
+    "csv": "to_csv",
+    "excel": "to_excel",
+    "json": "to_json",
+    "parquet": "to_parquet",
+    "feather": "to_feather",
+    "pickle": "to_pickle",
+    "hdf": "to_hdf",
+    "html": "to_html",
+    "latex": "to_latex"
+}
+
 
 def pandas_reader(input_config: InputModel, columns: list[str] | None = None, **kwargs) -> pd.DataFrame:
     """Read data using pandas and return a pandas DataFrame.
@@ -18,39 +64,14 @@ def pandas_reader(input_config: InputModel, columns: list[str] | None = None, **
     :param kwargs: Additional keyword arguments for the pandas reader.
     :return: A pandas DataFrame containing the loaded data.
     """
-    static_args = input_config.args.copy()
-
     # Extract pandas-specific options
-    pandas_options = static_args.pop("pandas_options", {})
-
-    # Map API to pandas read function
-    api_mapping = {
-        "read_csv": pd.read_csv,
-        "read_excel": pd.read_excel,
-        "read_json": pd.read_json,
-        "read_parquet": pd.read_parquet,
-        "read_feather": pd.read_feather,
-        "read_pickle": pd.read_pickle,
-        "read_hdf": pd.read_hdf,
-        "read_sql": pd.read_sql,
-        "read_table": pd.read_table,
-        # Shorter aliases for convenience
-        "csv": pd.read_csv,
-        "excel": pd.read_excel,
-        "json": pd.read_json,
-        "parquet": pd.read_parquet,
-        "feather": pd.read_feather,
-        "pickle": pd.read_pickle,
-        "hdf": pd.read_hdf,
-        "sql": pd.read_sql,
-        "table": pd.read_table
-    }
-
-    if input_config.api not in api_mapping:
+    static_args, pandas_options = input_config.prepared_args("pandas_options")
+
+    if input_config.api not in _PANDAS_READERS:
         raise ValueError(f"Unsupported pandas API: {input_config.api}. "
-                         f"Supported APIs: {list(api_mapping.keys())}")
+                         f"Supported APIs: {list(_PANDAS_READERS.keys())}")
 
-    pandas_reader_func = api_mapping[input_config.api]
+    pandas_reader_func = _PANDAS_READERS[input_config.api]
 
     try:
         # Merge static_args with pandas_options and kwargs
@@ -67,18 +88,16 @@ def pandas_reader(input_config: InputModel, columns: list[str] | None = None, **
 
         # Filter columns if specified
         if columns:
-            if isinstance(columns, str):
-                columns = [columns]
-            # Check if all requested columns exist
-            missing_cols = set(columns) - set(pandas_df.columns)
-            if missing_cols:
+            available_cols = [
+                col for col in columns if col in pandas_df.columns]
+            # Only build the list of missing columns when the warning would be emitted
+            if len(available_cols) < len(columns) and logger.isEnabledFor(logging.WARNING):
                 logger.warning(
                     "Columns not found in data: {missing_cols}",
-                    missing_cols=list(missing_cols)
+                    missing_cols=[col for col in columns if col not in pandas_df.columns]
                 )
-            available_cols = [
-                col for col in columns if col in pandas_df.columns]
             if available_cols:
+                # __getitem__ rather than reindex, which fails on frames with duplicate column names
                 pandas_df = pandas_df[available_cols]
                 logger.info(
                     "Filtered on columns: {columns}", columns=available_cols)
@@ -112,10 +131,8 @@ def pandas_writer(output_config: OutputModel, data: Any, columns: list[str] | No
     :param columns: List of columns to select before writing. If None, all columns will be written.
     :param kwargs: Additional keyword arguments for the pandas writer.
     """
-    static_args = output_config.args.copy()
-
     # Extract pandas-specific options
-    pandas_options = static_args.pop("pandas_options", {})
+    static_args, pandas_options = output_config.prepared_args("pandas_options")
 
     try:
         # Convert data to pandas DataFrame if it's not already
@@ -124,8 +141,8 @@ def pandas_writer(output_config: OutputModel, data: Any, columns: list[str] | No
             pandas_df = data.toPandas()
             logger.debug("Converted Spark DataFrame to pandas DataFrame")
         elif isinstance(data, pd.DataFrame):
-            # Already a pandas DataFrame
-            pandas_df = data.copy()
+            # Already a pandas DataFrame; the write methods never mutate it, so no copy is needed
+            pandas_df = data
         else:
             # Try to convert to pandas DataFrame
             try:
@@ -137,8 +154,6 @@ def pandas_writer(output_config: OutputModel, data: Any, columns: list[str] | No
 
         # Filter columns if specified
         if columns:
-            if isinstance(columns, str):
-                columns = [columns]
             # Select only the specified columns that exist
             available_columns = [
                 col for col in columns if col in pandas_df.columns]
@@ -150,34 +165,11 @@ def pandas_writer(output_config: OutputModel, data: Any, columns: list[str] | No
                 logger.warning(
                     "None of the specified columns {columns} found in DataFrame", columns=columns)
 
-        # Map API to pandas write method
-        api_mapping = {
-            "to_csv": pandas_df.to_csv,
-            "to_excel": pandas_df.to_excel,
-            "to_json": pandas_df.to_json,
-            "to_parquet": pandas_df.to_parquet,
-            "to_feather": pandas_df.to_feather,
-            "to_pickle": pandas_df.to_pickle,
-            "to_hdf": pandas_df.to_hdf,
-            "to_html": pandas_df.to_html,
-            "to_latex": pandas_df.to_latex,
-            # Shorter aliases for convenience
-            "csv": pandas_df.to_csv,
-            "excel": pandas_df.to_excel,
-            "json": pandas_df.to_json,
-            "parquet": pandas_df.to_parquet,
-            "feather": pandas_df.to_feather,
-            "pickle": pandas_df.to_pickle,
-            "hdf": pandas_df.to_hdf,
-            "html": pandas_df.to_html,
-            "latex": pandas_df.to_latex
-        }
-
-        if output_config.api not in api_mapping:
+        if output_config.api not in _PANDAS_WRITE_METHODS:
             raise ValueError(f"Unsupported pandas API: {output_config.api}. "
-                             f"Supported APIs: {list(api_mapping.keys())}")
+                             f"Supported APIs: {list(_PANDAS_WRITE_METHODS.keys())}")
 
-        pandas_writer_func = api_mapping[output_config.api]
+        pandas_writer_func = getattr(pandas_df, _PANDAS_WRITE_METHODS[output_config.api])
 
         # Merge static_args with pandas_options and kwargs
         write_params = {**static_args, **pandas_options, **kwargs}
@@ -14,24 +14,22 @@ def spark_reader(spark: SparkSession, input_config: InputModel, columns: list[st
     for the specified API method. The 'columns' parameter is a list of columns to select from the DataFrame.
     If 'columns' is None, all columns will be selected.
 
+    The column selection is applied lazily on top of the read, so Spark's optimizer pushes the
+    projection down into the scan (column pruning for parquet, delta, jdbc, etc.) and the
+    unselected columns are never read. No reader-level schema is needed for that.
+
     To see the pyspark DataFrameReader API, refer to:
     https://spark.apache.org/docs/latest/api/python/reference/pyspark.sql/api/pyspark.sql.DataFrameReader.table.html
 
     :param spark: The Spark session.
     :param input_config: The InputModel containing the API and arguments for reading data.
+    :param columns: List of columns to select after reading. If None, all columns will be selected.
     :param kwargs: Additional keyword arguments for the reader.
-    If None, all columns will be selected.
     :return: A Spark DataFrame reader configured with the provided options.
     """
-    static_args = input_config.args.copy()
-    if "options" in static_args:
-        if static_args["options"]:
-            options = static_args["options"]
-            static_args.pop("options")
-            reader = getattr(spark.read.options(
-                **options), input_config.api)
-        else:
-            reader = getattr(spark.read, input_config.api)
+    static_args, options = input_config.prepared_args("options")
+    if options:
+        reader = getattr(spark.read.options(**options), input_config.api)
     else:
         reader = getattr(spark.read, input_config.api)
 
@@ -41,9 +39,7 @@ def spark_reader(spark: SparkSession, input_config: InputModel, columns: list[st
     )
 
     if columns:
-        if isinstance(columns, str):
-            columns = [columns]
-        # Select only the specified columns
+        # Select only the specified columns, pruned at the scan by the optimizer
         df = df.select(*columns)
         logger.info("Filter on columns: {columns}", columns=columns)
 
@@ -67,21 +63,15 @@ def spark_writer(output_config: OutputModel, df: DataFrame, columns: list[str] |
     """
     # Filter columns if specified
     if columns:
-        if isinstance(columns, str):
-            columns = [columns]
         # Select only the specified columns
         df = df.select(*columns)
         logger.info("Filter on columns: {columns}", columns=columns)
 
-    static_args = output_config.args.copy()
+    static_args, options = output_config.prepared_args("options")
 
     # Handle options configuration
-    if "options" in static_args:
-        options = static_args.pop("options")
-        if options:
-            writer = getattr(df.write.options(**options), output_config.api)
-        else:
-            writer = getattr(df.write, output_config.api)
+    if options:
+        writer = getattr(df.write.options(**options), output_config.api)
     else:
         writer = getattr(df.write, output_config.api)
 
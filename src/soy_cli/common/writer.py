@@ -1,9 +1,8 @@
+from collections.abc import Callable
 from typing import Any
 
 from soy_cli import logging
-from soy_cli.common.models import OutputModel
-from soy_cli.common.strategies.pandas import pandas_writer
-from soy_cli.common.strategies.spark import spark_writer
+from soy_cli.common.models import OUTPUTS_ADAPTER, OutputModel, normalize_columns
 
 IO_FILE = "io.yaml"
 SCHEMA_FILE = "schema.yaml"
@@ -13,7 +12,7 @@ logger = logging.getLogger(__name__)
 
 
 class WriterStrategy:
-    """Base class for writer strategies."""
+    """Base class for object-based writer strategies, accepted by `OutputManager.add_strategy`."""
 
     def write(self, output_config: OutputModel, data: Any, columns: list[str] | None = None, **kwargs) -> None:
         """Write data using the specific strategy implementation.
@@ -23,39 +22,47 @@ class WriterStrategy:
         raise NotImplementedError("Subclasses should implement this method")
 
 
-class SparkWriterStrategy(WriterStrategy):
-    """Strategy for writing data using Spark."""
+def _write_with_spark(output_config: OutputModel, data: Any, columns: list[str] | None = None, **kwargs) -> None:
+    """Write data using Spark writer."""
+    # Imported lazily so pyspark is only loaded when a spark output is written
+    from soy_cli.common.strategies.spark import spark_writer
+    spark_writer(output_config, data, columns, **kwargs)
 
-    def write(self, output_config: OutputModel, data: Any, columns: list[str] | None = None, **kwargs) -> None:
-        """Write data using Spark writer."""
-        return spark_writer(output_config, data, columns, **kwargs)
 
+def _write_with_pandas(output_config: OutputModel, data: Any, columns: list[str] | None = None, **kwargs) -> None:
+    """Write data using pandas writer."""
+    # Imported lazily so pandas is only loaded when a pandas output is written
+    from soy_cli.common.strategies.pandas import pandas_writer
+    pandas_writer(output_config, data, columns, **kwargs)
 
-class PandasWriterStrategy(WriterStrategy):
-    """Strategy for writing data using pandas."""
 
-    def write(self, output_config: OutputModel, data: Any, columns: list[str] | None = None, **kwargs) -> None:
-        """Write data using pandas writer."""
-        return pandas_writer(output_config, data, columns, **kwargs)
+# Writer functions by strategy name, called as `writer(output_config, data, columns, **kwargs)`
+_STRATEGIES: dict[str, Callable[..., None]] = {
+    'spark': _write_with_spark,
+    'pandas': _write_with_pandas,
+    # Add more strategies here as needed
+    # 'custom': custom_writer,
+}
 
 
 class OutputManager:
     """Manager class to handle output writing with different strategies."""
 
     def __init__(self, outputs_config: dict):
-        self._outputs = outputs_config
-        self._strategies = {
-            'spark': SparkWriterStrategy(),
-            'pandas': PandasWriterStrategy(),
-            # Add more strategies here as needed
-            # 'custom': CustomWriterStrategy(),
-        }
+        # Validate all outputs once up front so lookups and writes don't re-run pydantic validation
+        self._outputs: dict[str, OutputModel] = dict(zip(
+            outputs_config.keys(),
+            OUTPUTS_ADAPTER.validate_python(list(outputs_config.values())),
+            strict=True,
+        ))
+        # Copied so strategies added to this manager don't leak into other managers
+        self._strategies: dict[str, Callable[..., None]] = dict(_STRATEGIES)
 
     def __getitem__(self, key: str):
         """Get an output configuration by key."""
         if key not in self._outputs:
             raise KeyError(f"Output '{key}' not found")
-        return OutputModel.model_validate(self._outputs[key])
+        return self._outputs[key]
 
     def write(self, key: str, data: Any, columns: list[str] | None = None, **kwargs) -> None:
         """Write data using the specified strategy.
@@ -66,21 +73,22 @@ class OutputManager:
         :param strategy: The writer strategy to use (default: 'spark')
         :param kwargs: Additional keyword arguments for the writer
         """
-        output_config = OutputModel.model_validate(self[key])
-        if output_config.strategy not in self._strategies:
-            raise ValueError(
-                f"Unknown writer strategy: {output_config.strategy}. Available strategies: {list(self._strategies.keys())}")
-
+        output_config = self[key]
         if not output_config.strategy:
             raise ValueError(
                 f"Output configuration for '{key}' does not specify a strategy. Available strategies: {list(self._strategies.keys())}"
             )
-        writer_strategy: WriterStrategy = self._strategies[output_config.strategy]
+
+        writer = self._strategies.get(output_config.strategy)
+        if writer is None:
+            raise ValueError(
+                f"Unknown writer strategy: {output_config.strategy}. Available strategies: {list(self._strategies.keys())}")
+        columns = normalize_columns(columns)
 
         try:
             logger.debug(
                 "Writing data for output '{key}' using {strategy} strategy", key=key, strategy=output_config.strategy)
-            writer_strategy.write(output_config, data, columns, **kwargs)
+            writer(output_config, data, columns, **kwargs)
             logger.info("Successfully wrote data for output '{key}'", key=key, strategy=output_config.strategy,
                         api=output_config.api, args=output_config.args, columns=output_config.columns if output_config.columns else "'*'")
         except Exception as e:
@@ -88,8 +96,15 @@ class OutputManager:
                 "Failed to write data for output '{key}': {error}", key=key, error=str(e))
             raise
 
-    def add_strategy(self, name: str, strategy: WriterStrategy) -> None:
-        """Add a custom writer strategy."""
+    def add_strategy(self, name: str, strategy: Callable[..., None] | WriterStrategy) -> None:
+        """Add a custom writer strategy.
+
+        :param name: The strategy name referenced by output configurations
+        :param strategy: A writer function called as `strategy(output_config, data, columns, **kwargs)`,
+            or a `WriterStrategy` instance whose `write` method is used
+        """
+        if isinstance(strategy, WriterStrategy):
+            strategy = strategy.write
         self._strategies[name] = strategy
         logger.info("Added writer strategy: {name}", name=name)
 
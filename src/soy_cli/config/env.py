@@ -1,3 +1,4 @@
+import functools
 import os
 from enum import Enum
 from pathlib import Path
@@ -11,6 +12,10 @@ class Environments(Enum):
     PROD = "prod"
 
 
+# Valid values of ENV_FILE_PATH
+_ENVIRONMENTS = [environment.value for environment in Environments]
+
+
 class EnvSettings(BaseSettings):
 
     model_config = SettingsConfigDict(
@@ -22,14 +27,20 @@ class EnvSettings(BaseSettings):
     DATABRICKS_CLUSTER_ID: str
     LOG_LEVEL: str = "INFO"
     LOG_TO_JSON: bool = False
+    TRUST_CONFIG: bool = False
+    LOG_FUNC_ARGS: bool = False
 
 
+@functools.lru_cache(maxsize=1)
 def get_env() -> EnvSettings:
-    """Get the environment settings based on the current environment."""
+    """Get the environment settings based on the current environment.
+
+    The settings are read and validated once; later calls return the same instance.
+    """
     _env = os.getenv("ENV_FILE_PATH", "dev")
-    if _env not in list(Environments._value2member_map_):
+    if _env not in _ENVIRONMENTS:
         raise ValueError(
-            f"Invalid environment: {_env}. Must be one of {list(Environments._value2member_map_)}.")
+            f"Invalid environment: {_env}. Must be one of {_ENVIRONMENTS}.")
 
     # Ensure the .env file is loaded from the correct path
     env_file_path = Path(__file__).parent / f".env.{_env}"
@@ -1,23 +1,41 @@
+import functools
 import time
+from typing import TYPE_CHECKING
 
 import requests
-from databricks.connect import DatabricksSession
 from databricks.sdk.core import Config
-from pyspark.sql import SparkSession
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    # Only needed for annotations; imported lazily where a session is actually created
+    from pyspark.sql import SparkSession
 
 from soy_cli import logging
 from soy_cli.config.env import env
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so cluster API polls reuse pooled TCP/TLS connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# Polling intervals (seconds) used while waiting for the cluster to start
+_WAIT_INITIAL_DELAY = 2
+_WAIT_MAX_DELAY = 30
+
 # Suppress gRPC warnings
 # os.environ['GRPC_VERBOSITY'] = 'ERROR'
 # os.environ['GRPC_TRACE'] = ''
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get the Databricks configuration from environment settings.
 
+    The configuration is created once and reused, so its resolved credentials provider (and any
+    OAuth token it caches until expiry) is shared by every cluster API call instead of
+    re-authenticating on each poll.
+
     :return Config: A Config object containing the Databricks profile ID and cluster ID.
     """
     return Config(
@@ -39,7 +57,7 @@ def get_cluster_state(config: Config | None = None) -> str:
 
     headers = config.authenticate()
     url = f"{config.host}/api/2.0/clusters/get"
-    response = requests.get(
+    response = _SESSION.get(
         url,
         headers=headers,
         timeout=10,
@@ -83,7 +101,7 @@ def start_cluster(config: Config | None = None) -> bool:
 
     headers = config.authenticate()
     url = f"{config.host}/api/2.0/clusters/start"
-    response = requests.post(
+    response = _SESSION.post(
         url,
         headers=headers,
         json={
@@ -122,7 +140,7 @@ def stop_cluster(config: Config | None = None) -> bool:
 
     headers = config.authenticate()
     url = f"{config.host}/api/2.0/clusters/delete"
-    response = requests.post(
+    response = _SESSION.post(
         url,
         headers=headers,
         json={
@@ -150,8 +168,12 @@ def stop_cluster(config: Config | None = None) -> bool:
 
 
 def wait_for_cluster() -> str:
-    """Wait for the Databricks cluster to be running."""
-    delta_t = 30
+    """Wait for the Databricks cluster to be running.
+
+    The cluster state is polled with exponential backoff (2s, 4s, 8s, ... capped at 30s),
+    so clusters that start quickly are detected without waiting a full polling interval.
+    """
+    delta_t = _WAIT_INITIAL_DELAY
     while True:
         cluster_state = get_cluster_state()
         if cluster_state == "RUNNING":
@@ -161,24 +183,26 @@ def wait_for_cluster() -> str:
             cluster_state=cluster_state,
         )
         time.sleep(delta_t)
+        delta_t = min(delta_t * 2, _WAIT_MAX_DELAY)
     return cluster_state
 
 
-def create_databricks_session() -> SparkSession:
+def create_databricks_session() -> "SparkSession":
     """Create a Databricks session if it does not already exist."""
+    # Imported lazily so cluster API helpers don't pay for loading Spark and Databricks Connect
+    from databricks.connect import DatabricksSession
+    from pyspark.sql import SparkSession
+
     spark_session = SparkSession.getActiveSession()
 
     if spark_session:
         return spark_session
 
-    config = Config(
-        profile=env.DATABRICKS_PROFILE_ID,
-        cluster_id=env.DATABRICKS_CLUSTER_ID,
-    )
+    config = get_config()
     return DatabricksSession.builder.sdkConfig(config).getOrCreate()
 
 
-def get_databricks_session() -> SparkSession | None:
+def get_databricks_session() -> "SparkSession | None":
     """Get or create a Databricks session."""
     try:
         cluster_state = get_cluster_state()
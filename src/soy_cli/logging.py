@@ -1,6 +1,6 @@
-import re
 import string
 import typing
+from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING  # noqa: F401 - re-exported as soy_cli.logging levels
 from typing import Any
 
 import structlog
@@ -14,8 +14,22 @@ from soy_cli.utils import convert_snake_case_to_camel_case, get_package_name
 PACKAGE_NAME = get_package_name()
 CAMEL_CASE_PACKAGE_NAME = convert_snake_case_to_camel_case(PACKAGE_NAME)
 
+# Old-style string interpolation: every printf conversion type (%s, %d, %i, %o, %u, %x, %X, %e, %E,
+# %f, %F, %g, %G, %c, %r, %a, %%) with an optional mapping key such as %(name)s
+_OLD_STYLE_CONVERSIONS = frozenset("diouxXeEfFgGcrsa%")
+
+# Shared formatter used to interpolate log messages
+_FORMATTER = string.Formatter()
+
+# Minimum numeric level set by configure_logging; records below it are dropped before any formatting
+_MIN_LEVEL = 0
+
+# (use_json, numeric log level) applied by the last configure_logging call
+_LAST_CONFIG: tuple[bool | None, int] | None = None
+
 # Global logger cache
-_logger_cache: dict[str, structlog.BoundLogger] = {}
+_logger_cache: dict[str, "StructuredLogger"] = {}
+_cache_get = _logger_cache.get
 
 
 class StructuredLogger:
@@ -53,6 +67,15 @@ class StructuredLogger:
         """Log a message at the specified level with structured data."""
         self._log(level, msg, **kwargs)
 
+    def isEnabledFor(self, level: int | str) -> bool:
+        """Return whether a message at the given level would be emitted.
+
+        Use it to skip building expensive log arguments that would be discarded anyway.
+        """
+        if isinstance(level, str):
+            level = structlog.stdlib.NAME_TO_LEVEL[level.lower()]
+        return level >= _MIN_LEVEL
+
     def bind(self, **kwargs: Any) -> "StructuredLogger":
         """Bind additional context to the logger."""
         bound_logger = self._logger.bind(**kwargs)
@@ -64,10 +87,25 @@ class StructuredLogger:
         return StructuredLogger(new_logger)
 
     def _log(self, level: int | str, msg: str, **kwargs: Any) -> None:
+        # Drop filtered records before any detection or interpolation work
+        numeric_level = structlog.stdlib.NAME_TO_LEVEL.get(str(level).lower(), INFO) if isinstance(level, str) else level
+        if numeric_level < _MIN_LEVEL:
+            return
+
         # Merge 'extra' dict if present
         extra = kwargs.pop("extra", None)
         if extra and isinstance(extra, dict):
             kwargs = {**extra, **kwargs}
+
+        # Get the appropriate log method
+        log_method = getattr(self._logger, str(
+            level).lower(), self._logger.info)
+
+        # Fast path: without braces or '%' there is nothing to check or interpolate
+        if "{" not in msg and "}" not in msg and "%" not in msg:
+            log_method(msg, **kwargs)
+            return
+
         # Check for old-style string interpolation patterns
         if _detect_old_style_interpolation(msg):
             raise TypeError(
@@ -79,10 +117,6 @@ class StructuredLogger:
         # Handle string interpolation
         interpolated_msg, remaining_kwargs = _interpolate_message(msg, kwargs)
 
-        # Get the appropriate log method
-        log_method = getattr(self._logger, str(
-            level).lower(), self._logger.info)
-
         # Log with remaining kwargs as structured data
         log_method(interpolated_msg, **remaining_kwargs)
 
@@ -98,21 +132,35 @@ def _detect_old_style_interpolation(msg: str) -> bool:
     :param msg: The log message to check for old-style interpolation patterns.
     :return: bool: True if old-style interpolation patterns are found, False otherwise.
     """
-    # Pattern to match old-style string interpolation
-    # Matches: %s, %d, %f, %r, %c, %x, %o, %(name)s, %(key)d, etc.
-    old_style_pattern = r"%(?:\([^)]+\))?[sdfrcoxi%]"
-    return bool(re.search(old_style_pattern, msg))
+    # Single pass from one '%' to the next; str.find skips the text in between at C speed,
+    # and messages without any '%' are rejected by the first find
+    conversions = _OLD_STYLE_CONVERSIONS
+    start = msg.find("%")
+    while start >= 0:
+        next_char = msg[start + 1:start + 2]
+        if next_char in conversions:
+            return True
+        if next_char == "(":
+            # Mapping key: the conversion type follows the closing parenthesis
+            end = msg.find(")", start + 2)
+            if end >= 0 and msg[end + 1:end + 2] in conversions:
+                return True
+        start = msg.find("%", start + 1)
+    return False
+
+
+class SafeDict(dict):
+    """Mapping that leaves placeholders without a value as {placeholder} when formatting."""
+
+    def __missing__(self, key):
+        """Return the placeholder unchanged."""
+        return "{" + key + "}"
 
 
 def _interpolate_message(msg: str, kwargs: dict[str, Any]) -> tuple[str, dict[str, Any]]:
     """Interpolate only the placeholders for which a value is provided, leave others as {placeholder}."""
-
-    class SafeDict(dict):
-        def __missing__(self, key):
-            return "{" + key + "}"
-
     try:
-        interpolated_msg = string.Formatter().vformat(msg, (), SafeDict(**kwargs))
+        interpolated_msg = _FORMATTER.vformat(msg, (), SafeDict(kwargs))
     except Exception:
         interpolated_msg = msg
     return interpolated_msg, kwargs
@@ -158,13 +206,18 @@ def configure_logging(use_json: bool | None = None, log_level: str | int = "INFO
             raise ValueError(f"Invalid log level: {log_level}")
         log_level = numeric_log_level
 
+    # Reconfiguring structlog with identical settings would only rebuild the same processor chain
+    global _LAST_CONFIG
+    if (use_json, log_level) == _LAST_CONFIG:
+        return
+
     shared_processors: list[Processor] = [
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
         structlog.contextvars.merge_contextvars,
     ]
 
-    if log_level < 20:
+    if log_level < INFO:
         shared_processors += [
             structlog.processors.CallsiteParameterAdder(
                 [
@@ -201,6 +254,10 @@ def configure_logging(use_json: bool | None = None, log_level: str | int = "INFO
     # Clear the logger cache to ensure new loggers use the updated configuration
     _logger_cache.clear()
 
+    global _MIN_LEVEL
+    _MIN_LEVEL = log_level
+    _LAST_CONFIG = (use_json, log_level)
+
     # Configure structlog
     structlog.configure(
         processors=[*shared_processors, *renderers],
@@ -265,10 +322,11 @@ def getLogger(name: str) -> StructuredLogger:
         bound_logger.info("User action", action="login")
         # Output: "User action" with structured data: user_id=123, session_id="abc123, action="login"
     """
-    if name not in _logger_cache:
-        # Get the structlog logger
-        structlog_logger = structlog.get_logger(name)
-        # Wrap it in our StructuredLogger
-        _logger_cache[name] = StructuredLogger(structlog_logger)
-
-    return _logger_cache[name]
+    # Fast path: a single lookup for already created loggers
+    logger = _cache_get(name)
+    if logger is not None:
+        return logger
+
+    # Get the structlog logger and wrap it in our StructuredLogger
+    logger = _logger_cache[name] = StructuredLogger(structlog.get_logger(name))
+    return logger
@@ -1,16 +1,121 @@
+import functools
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 from pyspark.sql import SparkSession
+from pyspark.sql import functions as F
 
 from soy_cli import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound of tables whose details are fetched concurrently
+_MAX_DETAIL_WORKERS = 16
+
+# Unity Catalog view listing the columns of the tables in one catalog
+_INFORMATION_SCHEMA_COLUMNS = "`{catalog}`.information_schema.columns"
+
+# Row count in the table statistics, e.g. "1024 bytes, 42 rows"
+_STATISTICS_ROWS_RE = re.compile(r"(\d+)\s+rows")
+
+
+def get_table_row_count(spark_session: SparkSession, full_table_name: str) -> int:
+    """Get the exact row count of the current version of a table.
+
+    :param spark_session: Spark session to execute SQL queries
+    :param full_table_name: Table name in the format 'catalog.schema.table_name'
+    :return: Number of rows in the table
+    """
+    return spark_session.table(full_table_name).count()
+
+
+def get_table_approx_row_count(spark_session: SparkSession, full_table_name: str) -> int:
+    """Get the row count of a table from the statistics stored in the table metadata.
+
+    Reading the statistics from `DESCRIBE TABLE EXTENDED` avoids scanning every data file of the table,
+    but they are only as recent as the last `ANALYZE TABLE`, so writes since then are not reflected.
+    A full `count()` is only run when the table has no row statistics.
+
+    :param spark_session: Spark session to execute SQL queries
+    :param full_table_name: Table name in the format 'catalog.schema.table_name'
+    :return: Number of rows in the table as of its last statistics computation
+    """
+    for row in spark_session.sql(f"DESCRIBE TABLE EXTENDED {full_table_name}").collect():
+        if row['col_name'] == 'Statistics':
+            match = _STATISTICS_ROWS_RE.search(row['data_type'] or "")
+            if match:
+                return int(match.group(1))
+            break
+
+    logger.debug(
+        "No row statistics for table {full_table_name}, counting rows", full_table_name=full_table_name
+    )
+    return get_table_row_count(spark_session, full_table_name)
+
+
+def get_tables_columns(spark_session: SparkSession, table_list: list[str]) -> dict[str, list[str]]:
+    """Get the column names of several tables with a single query on the information schemas.
+
+    Each catalog's own information schema is queried with plain equality filters on its schema and
+    table name columns, so the lookups are pushed down instead of scanning the columns of the whole metastore.
+
+    :param spark_session: Spark session to execute SQL queries
+    :param table_list: List of table names in the format 'catalog.schema.table_name'
+    :return: Column names of each table, in ordinal order, keyed by the lowercase full table name.
+             Empty if the information schema is not available, in which case callers read the columns per table.
+    """
+    # Unity Catalog stores identifiers in lowercase
+    tables_by_catalog = defaultdict(set)
+    for table in table_list:
+        catalog, schema, table_name = table.lower().split('.')
+        tables_by_catalog[catalog].add((schema, table_name))
+
+    def _catalog_columns(catalog: str, tables: set[tuple[str, str]]):
+        table_filter = functools.reduce(
+            lambda left, right: left | right,
+            (
+                (F.col("table_schema") == schema) & (F.col("table_name") == table_name)
+                for schema, table_name in sorted(tables)
+            ),
+        )
+        return (
+            spark_session.table(_INFORMATION_SCHEMA_COLUMNS.format(catalog=catalog))
+            .where(table_filter)
+            .select("table_catalog", "table_schema", "table_name", "ordinal_position", "column_name")
+        )
+
+    try:
+        rows = (
+            functools.reduce(
+                lambda left, right: left.unionByName(right),
+                (_catalog_columns(catalog, tables) for catalog, tables in tables_by_catalog.items()),
+            )
+            .groupBy("table_catalog", "table_schema", "table_name")
+            .agg(F.sort_array(F.collect_list(F.struct("ordinal_position", "column_name"))).alias("columns"))
+            .collect()
+        )
+    except Exception as e:
+        logger.warning(
+            "Could not read columns from the information schema, reading them per table", error=str(e)
+        )
+        return {}
+
+    return {
+        ".".join([row['table_catalog'], row['table_schema'], row['table_name']]).lower():
+            [column['column_name'] for column in row['columns']]
+        for row in rows
+    }
+
 
 def get_table_details(
     spark_session: SparkSession,
     catalog: str,
     schema: str,
-    table_name: str
+    table_name: str,
+    columns: list[str] | None = None,
+    approx_row_count: bool = False,
 ) -> dict:
     """Get detailed information about a table including count, size, and metadata.
 
@@ -18,6 +123,10 @@ def get_table_details(
     :param catalog: Catalog name of the table
     :param schema: Schema name of the table
     :param table_name: Name of the table
+    :param columns: Column names of the table if already known (e.g. from `get_tables_columns`),
+                    otherwise they are read from the table schema
+    :param approx_row_count: Report `approx_row_count` from the table statistics instead of an exact
+                             `row_count`, trading freshness for not scanning the table
     :return: Dictionary containing table details such as format, number of files, size in bytes,
              size in MB, row count, creation date, properties, and location
     """
@@ -32,11 +141,16 @@ def get_table_details(
         table_info = spark_session.sql(
             f"DESCRIBE DETAIL {full_table_name}").collect()[0]
 
-        # Get row count (this can be expensive for large tables)
-        row_count = spark_session.table(full_table_name).count()
+        if approx_row_count:
+            row_count_field = 'approx_row_count'
+            row_count = get_table_approx_row_count(spark_session, full_table_name)
+        else:
+            row_count_field = 'row_count'
+            row_count = get_table_row_count(spark_session, full_table_name)
 
-        # Validate table name to prevent SQL injection
-        columns = spark_session.sql(f"SELECT * FROM {full_table_name} LIMIT 1").columns  # noqa: S608
+        # Column names come from the resolved table schema, without running a job
+        if columns is None:
+            columns = spark_session.table(full_table_name).columns
 
         return {
             "catalog": catalog,
@@ -47,7 +161,7 @@ def get_table_details(
             'num_files': table_info['numFiles'],
             'size_in_bytes': table_info['sizeInBytes'],
             'size_in_mb': round(table_info['sizeInBytes'] / (1024 * 1024), 2) if table_info['sizeInBytes'] else 0,
-            'row_count': row_count,
+            row_count_field: row_count,
             'created_at': str(table_info['createdAt']),
             'properties': table_info['properties'],
             'location': table_info['location'],
@@ -63,22 +177,35 @@ def get_table_details(
         }
 
 
-def get_all_tables_summary(spark_session: SparkSession, table_list: list[str]) -> pd.DataFrame:
+def get_all_tables_summary(
+    spark_session: SparkSession, table_list: list[str], approx_row_count: bool = False
+) -> pd.DataFrame:
     """Get summary information for all tables in the provided list.
 
     List must have table names in the format 'catalog.schema.table_name'.
+    The column lists of all tables are fetched with one information schema query, and the remaining
+    details of each table are independent driver round-trips, so they are fetched concurrently.
 
     :param table_list: List of table names to summarize
+    :param approx_row_count: Report row counts from the table statistics, see `get_table_details`
     :return: List of dictionaries containing summary information for each table
     """
-    summary_data = []
+    row_count_field = 'approx_row_count' if approx_row_count else 'row_count'
+    if not table_list:
+        return pd.DataFrame(columns=[row_count_field])
+
+    tables_columns = get_tables_columns(spark_session, table_list)
 
-    for table_full_name in table_list:
+    def _table_details(table_full_name: str) -> dict:
         catalog, schema, table_name = table_full_name.split('.')
-        summary_data += [get_table_details(spark_session,
-                                           catalog, schema, table_name)]
+        return get_table_details(
+            spark_session, catalog, schema, table_name, columns=tables_columns.get(table_full_name.lower()),
+            approx_row_count=approx_row_count)
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_DETAIL_WORKERS, len(table_list))) as executor:
+        summary_data = list(executor.map(_table_details, table_list))
 
-    summary_df = pd.DataFrame(summary_data)
-    summary_df.sort_values(by="row_count", ascending=False, inplace=True)
+    # Sort the records before building the DataFrame; tables that failed (no row count) go last
+    summary_data.sort(key=lambda details: details.get(row_count_field, -1), reverse=True)
 
-    return summary_df
+    return pd.DataFrame(summary_data)
@@ -1,10 +1,20 @@
+import functools
 import importlib.util
 import os
+import sys
 
 
+@functools.lru_cache(maxsize=1)
 def get_package_name() -> str:
-    """Dynamically determine the package name of the current module."""
-    spec = importlib.util.find_spec(__package__ or __name__.split('.')[0])
+    """Dynamically determine the package name of the current module.
+
+    The result is invariant for the lifetime of the process, so it is computed only once.
+    """
+    # Top-level package, also when this module is the __init__ of the soy_cli.utils package
+    name = (__package__ or __name__).split('.')[0]
+    # The package is normally already imported, so its spec can be read without querying the finders
+    module = sys.modules.get(name)
+    spec = getattr(module, "__spec__", None) or importlib.util.find_spec(name)
     if spec and spec.name:
         package_name = spec.name
     else:
@@ -1,12 +1,39 @@
+import functools
 import importlib.util
-import inspect
+import itertools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
 from typing import Any
 
 import jinja2
 import yaml
 
+# Prefer the libyaml C bindings, which parse several times faster than the pure-Python loader
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared environment that raises errors for undefined variables.
+# Rendered values end up in YAML configs, not HTML, so they must not be HTML-escaped.
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.BaseLoader(),
+    autoescape=False,  # noqa: S701 - templates render YAML config values, not HTML
+    undefined=jinja2.StrictUndefined,
+    auto_reload=False,
+    cache_size=400,
+    # String leaves are rendered one by one, keep the trailing newline of block scalars like a
+    # whole-document render would
+    keep_trailing_newline=True,
+)
+
+# Parsed (not yet rendered) YAML config files by absolute path, with the file mtime in ns they were parsed at.
+# One entry per path: a modified file replaces its previous entry.
+_PARSED_CONFIG_CACHE: dict[str, tuple[int, Any]] = {}
+
+# Modules loaded from a file path by (module name, file path), with the file mtime in ns they were executed at.
+# One entry per module: a modified file replaces the previously executed module.
+_MODULE_CACHE: dict[tuple[str, str], tuple[int, ModuleType]] = {}
+
 
 def safe_load_yaml(file_path: str) -> Any:
     """Load a YAML file safely.
@@ -14,12 +41,87 @@ def safe_load_yaml(file_path: str) -> Any:
     :param str file_path: The path to the YAML file.
     :return Any: The loaded YAML data.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"The file {file_path} does not exist.")
+    # Read the raw bytes in one call; the parser decodes them itself, skipping Python's text layer.
+    # Opening directly (instead of checking os.path.exists first) saves a stat call on the common path.
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"The file {file_path} does not exist.") from e
+    return yaml.load(data, Loader=_YamlSafeLoader)  # noqa: S506 - always a safe loader
+
+
+# Leaf templates of config files form a small, finite key space
+@functools.lru_cache(maxsize=256)
+def _compile_template(source: str) -> jinja2.Template:
+    """Compile a template source once; `Environment.from_string` would re-parse and re-compile it on every call."""
+    return _JINJA_ENV.from_string(source)
+
+
+def _has_jinja_markup(template_str: str) -> bool:
+    """Return whether a string contains a Jinja expression, statement or comment.
+
+    Plain substring checks run in C and are much cheaper than compiling a template that renders to itself.
+    """
+    return "{{" in template_str or "{%" in template_str or "{#" in template_str
+
+
+def _render_dict(node: dict, vars_to_render: dict[str, Any]) -> dict:
+    """Render the keys and values of a mapping, copying it only once an item changes."""
+    rendered_dict = None
+    for index, (key, value) in enumerate(node.items()):
+        rendered_key = _render_tree(key, vars_to_render)
+        rendered_value = _render_tree(value, vars_to_render)
+        if rendered_dict is None and (rendered_key is not key or rendered_value is not value):
+            rendered_dict = dict(itertools.islice(node.items(), index))
+        if rendered_dict is not None:
+            rendered_dict[rendered_key] = rendered_value
+    return node if rendered_dict is None else rendered_dict
+
+
+def _render_list(node: list, vars_to_render: dict[str, Any]) -> list:
+    """Render the items of a sequence, copying it only once an item changes."""
+    rendered_list = None
+    for index, item in enumerate(node):
+        rendered_item = _render_tree(item, vars_to_render)
+        if rendered_list is None and rendered_item is not item:
+            rendered_list = node[:index]
+        if rendered_list is not None:
+            rendered_list.append(rendered_item)
+    return node if rendered_list is None else rendered_list
+
+
+def _render_tree(node: Any, vars_to_render: dict[str, Any]) -> Any:
+    """Render the string keys and leaves of a loaded YAML tree with Jinja2, leaving other values unchanged.
+
+    Containers without any templated value are returned as is, so static parts of the tree are shared
+    with the input instead of being copied.
+    """
+    if isinstance(node, str):
+        if not _has_jinja_markup(node):
+            return node
+        return _compile_template(node).render(vars_to_render)
+    if isinstance(node, dict):
+        return _render_dict(node, vars_to_render)
+    if isinstance(node, list):
+        return _render_list(node, vars_to_render)
+    return node
+
+
+def safe_load_yamls(file_paths: list[str]) -> list[Any]:
+    """Load several YAML files safely, reading them concurrently.
+
+    Prefer it over calling `safe_load_yaml` in a loop when many config files are loaded at once
+    (e.g. a tree of asset directories): the file reads release the GIL, so filesystem latency overlaps.
+
+    :param list[str] file_paths: The paths to the YAML files.
+    :return list[Any]: The loaded YAML data of each file, in the order of `file_paths`.
+    """
+    if len(file_paths) <= 1:
+        return [safe_load_yaml(file_path) for file_path in file_paths]
 
-    with open(file_path) as f:
-        content = yaml.safe_load(f)
-    return content
+    with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+        return list(executor.map(safe_load_yaml, file_paths))
 
 
 def render_configs_with_jinja(
@@ -27,74 +129,122 @@ def render_configs_with_jinja(
 ) -> str | Any:
     """Render a dictionary of configurations with Jinja2.
 
+    Dictionaries are rendered leaf by leaf, so they are not dumped to YAML and parsed back.
+
     :param Union[str, dict[str, any]] configs: The configurations to render.
     :param dict[str, Any] vars_to_render: The variables to render the configurations with.
     :return dict[str, Any]: The rendered configurations.
     :raises ValueError: If a variable in the template is not defined in vars_to_render.
     """
-    # Convert the template YAML data to a string
-    template_str = yaml.dump(configs) if isinstance(configs, dict) else configs
-
-    # Create a Jinja2 environment that raises errors for undefined variables
-    env = jinja2.Environment(
-        loader=jinja2.BaseLoader(),
-        autoescape=True,
-        undefined=jinja2.StrictUndefined
-    )
+    try:
+        if isinstance(configs, dict):
+            return _render_tree(configs, vars_to_render)
 
-    # Load the template string into the environment
-    template = env.from_string(template_str)
+        # Nothing to render, skip compiling the template
+        if not _has_jinja_markup(configs):
+            return configs
 
-    # Render the template with the data YAML data
-    try:
-        rendered_template_str = template.render(vars_to_render)
+        # Load the compiled template and render it
+        return _compile_template(configs).render(vars_to_render)
     except jinja2.UndefinedError as e:
         raise ValueError(f"Missing variable in template: {e}") from e
 
-    # Convert the rendered YAML string back to a Python dictionary
-    if isinstance(configs, dict):
-        rendered_template_yaml = yaml.safe_load(rendered_template_str)
-        rendered_template_str = rendered_template_yaml
 
-    return rendered_template_str
+def render_config_file(file_path: str, vars_to_render: dict[str, Any]) -> Any:
+    """Load a YAML configuration file and render it with Jinja2.
+
+    The parsed file is cached by path and modification time, and its templated values are compiled
+    once by `render_configs_with_jinja`, so rendering an unchanged file again with other variables
+    only runs the templates. Static parts of the result are shared with the cached tree and must not be mutated.
+
+    :param str file_path: The path to the YAML configuration file.
+    :param dict[str, Any] vars_to_render: The variables to render the configurations with.
+    :return Any: The rendered configurations.
+    :raises FileNotFoundError: If the file does not exist.
+    :raises ValueError: If a variable in the template is not defined in vars_to_render.
+    """
+    abs_path = os.path.abspath(file_path)
+    try:
+        mtime = os.stat(abs_path).st_mtime_ns
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"The file {file_path} does not exist.") from e
+
+    cached = _PARSED_CONFIG_CACHE.get(abs_path)
+    if cached is not None and cached[0] == mtime:
+        configs = cached[1]
+    else:
+        configs = safe_load_yaml(abs_path)
+        _PARSED_CONFIG_CACHE[abs_path] = (mtime, configs)
+    return render_configs_with_jinja(configs, vars_to_render)
 
 
 def load_module_from_path(
     module_name: str,
-    module_file_path: str
+    module_file_path: str,
+    register: bool = True,
 ):
     """Load a module from a file path.
 
+    Modules are cached by name, path and modification time, so loading an unchanged file again
+    returns the already executed module instead of re-executing it.
+
     :param str module_name: The name to be assigned to the taken on the module.
     :param str module_file_path: The file path to the module.
+    :param bool register: Keep the module registered in `sys.modules` (and in the module cache).
+        Pass False when only the returned module object is needed, so it can be garbage collected
+        once the caller drops it; it is then registered only while its code executes.
     """
     try:
+        cache_key = (module_name, module_file_path)
+        mtime = os.stat(module_file_path).st_mtime_ns
+        cached = _MODULE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            module = cached[1]
+            if register:
+                # Keep the cached module visible under its name, as a fresh load would
+                sys.modules[module_name] = module
+            return module
+
         spec = importlib.util.spec_from_file_location(
             module_name,
             module_file_path
         )
         module = importlib.util.module_from_spec(spec)
+        previous_module = sys.modules.get(module_name)
         sys.modules[module_name] = module
-        spec.loader.exec_module(module)
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            if not register:
+                # The module code may rely on its registration while executing (e.g. dataclasses, pydantic)
+                if previous_module is None:
+                    sys.modules.pop(module_name, None)
+                else:
+                    sys.modules[module_name] = previous_module
     except Exception as e:
         raise Exception(
             f"Failed to load module {module_name} from {module_file_path}: {e}"
         ) from e
+    if register:
+        _MODULE_CACHE[cache_key] = (mtime, module)
     return module
 
 
-def load_class_from_module(module_name: str):
+def load_class_from_module(module_name: ModuleType):
     """Load the class object from the module."""
-    obj_list = [m[0] for m in inspect.getmembers(
-        module_name, inspect.isclass) if m[1].__module__ == module_name.__name__]
-    if len(obj_list) > 1:
-        raise Exception(
-            """
+    class_obj = None
+    # Scan the namespace directly; inspect.getmembers would getattr and sort every name of the module
+    for value in module_name.__dict__.values():
+        if isinstance(value, type) and value.__module__ == module_name.__name__:
+            if class_obj is not None:
+                raise Exception(
+                    """
             Asset main.py file contains more than one class asset. \n 
             Please break it into multiple assets.
             """
-        )
+                )
+            class_obj = value
 
-    class_name = obj_list[0]
-    class_obj = getattr(module_name, class_name)
+    if class_obj is None:
+        raise Exception(f"Asset module {module_name.__name__} does not define a class asset.")
     return class_obj
@@ -3,32 +3,50 @@ import typing
 from functools import wraps
 
 from soy_cli import logging
+from soy_cli.config.env import env
 
 logger = logging.getLogger(__name__)
 
 
+def _call_context(func: typing.Callable, args: tuple, kwargs: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Build the structured data logged for a decorated call.
+
+    Arguments are only included when `LOG_FUNC_ARGS` is enabled, since they can be large objects
+    (e.g. DataFrames) that are expensive to render.
+    """
+    context: dict[str, typing.Any] = {"func_name": func.__name__}
+    if env.LOG_FUNC_ARGS:
+        context["func_args"] = args
+        context["func_kwargs"] = kwargs
+    return context
+
+
 def timing_decorator(func: typing.Callable) -> typing.Callable:
     """Measure and log function execution time."""
     @wraps(func)
     def _timming_decorator_wrapper(*args: list[typing.Any], **kwargs: dict[str, typing.Any]) -> typing.Any:
-        start_time = time.time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            # Timings are only logged at DEBUG, so skip measuring them; failures are still logged
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                logger.exception("Failed to execute function", **_call_context(func, args, kwargs))
+                raise
 
-        post_logger = logger.bind(func_args=list(
-            args), func_kwargs=kwargs, func_name=func.__name__)
+        start_time = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
         except Exception:
-            end_time = time.time()
-            execution_time = end_time - start_time
-            post_logger.exception(
-                "Failed to execute function", execution_time=execution_time)
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            logger.exception(
+                "Failed to execute function", execution_time=execution_time, **_call_context(func, args, kwargs))
             raise
         else:
-            end_time = time.time()
-            execution_time = end_time - start_time
-            post_logger.debug(
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            logger.debug(
                 "Completed function {execution_time}",
                 execution_time=execution_time,
+                **_call_context(func, args, kwargs),
             )
             return result
     return _timming_decorator_wrapper
@@ -1,6 +1,5 @@
 """Pytest configuration for structured test output with clear log isolation."""
 import logging
-from io import StringIO
 
 import pytest
 
@@ -10,62 +9,41 @@ class TestStructurePlugin:
 
     def __init__(self):
         self.current_test = None
-        self.log_capture = None
+        self.log_lines: list[str] = []
 
     def _print_test_header(self, item):
         """Print test start banner."""
         # test_name = f"{item.cls.__name__ if item.cls else 'Module'}::{item.name}"
         print(f"{'='*80}")
 
-    def _setup_log_capture(self):
-        """Set up log capture for application logs."""
-        import sys
-
-        # Capture both stdout and stderr to catch all log output
-        self.log_capture = StringIO()
-        self.original_stdout = sys.stdout
-        self.original_stderr = sys.stderr
-
-        # Redirect stderr (where structlog usually outputs) to our capture
-        sys.stderr = self.log_capture
-
-        root_logger = logging.getLogger()
-        original_handlers = root_logger.handlers[:]
-
-        return original_handlers
-
-    def _restore_streams(self, original_handlers):
-        """Restore original stdout/stderr and handlers."""
-        import sys
-
-        # Restore original streams
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
-
-        # Restore original handlers
-        root_logger = logging.getLogger()
-        root_logger.handlers = original_handlers
-
     def _print_logs_and_result(self, result):
         """Print application logs and test result."""
-        log_content = self.log_capture.getvalue().strip()
-        if log_content:
-            print("\n\n📋 APPLICATION LOGS:")
-            print("-" * 40)
-            for line in log_content.split('\n'):
-                if line.strip():
-                    print(f"{line}")
-        else:
-            print("\n\n📋 APPLICATION LOGS:")
-            print("-" * 40)
+        print("\n\n📋 APPLICATION LOGS:")
+        print("-" * 40)
+        printed = False
+        for line in self.log_lines:
+            if line.strip():
+                print(f"{line}")
+                printed = True
+        if not printed:
             print("- no logs captured -")
         print("-" * 40)
 
+    def pytest_runtest_logreport(self, report):
+        """Collect the stderr captured by pytest for each phase of the running test."""
+        # pytest's own capture already holds the output, so sys.stderr is never swapped here.
+        # Each report also carries the sections of earlier phases, so only this phase's one is read.
+        section_name = f"Captured stderr {report.when}"
+        for name, content in report.sections:
+            if name == section_name:
+                self.log_lines.extend(content.splitlines())
+
     @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_protocol(self, item, nextitem):
         """Structure test execution with clear boundaries."""
         self._print_test_header(item)
-        original_handlers = self._setup_log_capture()
+        self.log_lines = []
+        original_handlers = logging.getLogger().handlers[:]
 
         try:
             outcome = yield
@@ -75,7 +53,8 @@ class TestStructurePlugin:
             print(f"❌ TEST RESULT: ERROR - {e}")
             raise
         finally:
-            self._restore_streams(original_handlers)
+            # Restore original handlers
+            logging.getLogger().handlers = original_handlers
 
 
 def pytest_configure(config):
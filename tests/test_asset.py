@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from soy_cli.common import asset
+from soy_cli.common.asset import BaseAssetConfig
+from soy_cli.config.env import env
+
+IO_YAML = """
+name: sales
+inputs:
+  - name: orders
+    strategy: pandas
+    api: read_csv
+    args:
+      filepath_or_buffer: orders.csv
+      pandas_options:
+        sep: ";"
+    columns: colA
+outputs:
+  - name: report
+    strategy: pandas
+    api: to_csv
+    args:
+      path_or_buf: report.csv
+context:
+  nested:
+    a: 1
+"""
+
+
+@pytest.fixture
+def io_file(tmp_path):
+    """Write a sample io.yaml and return its path."""
+    path = tmp_path / "io.yaml"
+    path.write_text(IO_YAML)
+    return str(path)
+
+
+@pytest.mark.parametrize("trust_config", [False, True])
+def test_from_file_second_load_matches_first(monkeypatch, io_file, trust_config):
+    """Test that a config loaded again is validated the same way as on its first load."""
+    monkeypatch.setattr(env, "TRUST_CONFIG", trust_config)
+    first = BaseAssetConfig.from_file(io_file)
+    second = BaseAssetConfig.from_file(io_file)
+
+    assert second.inputs[0].columns == ["colA"]
+    assert second.outputs[0].columns == []
+    assert second.model_dump() == first.model_dump()
+    assert second.inputs[0] is not first.inputs[0]
+
+
+def test_from_file_trusted_copies_are_independent(monkeypatch, io_file):
+    """Test that changes made to a trusted config do not leak into later loads of the same file."""
+    monkeypatch.setattr(env, "TRUST_CONFIG", True)
+    BaseAssetConfig.from_file(io_file)
+    config = BaseAssetConfig.from_file(io_file)
+    config.inputs[0].args["pandas_options"]["sep"] = ","
+    config.inputs[0].columns.append("colB")
+    config.inputs[0]._data = "loaded"
+    config.context["nested"]["a"] = 2
+
+    reloaded = BaseAssetConfig.from_file(io_file)
+    assert reloaded.inputs[0].prepared_args("pandas_options") == (
+        {"filepath_or_buffer": "orders.csv"}, {"sep": ";"})
+    assert reloaded.inputs[0].columns == ["colA"]
+    assert reloaded.inputs[0]._data is None
+    assert reloaded.context == {"nested": {"a": 1}}
+
+
+def test_from_file_untrusted_loads_are_independent(monkeypatch, io_file):
+    """Test that changes made to a config do not leak into later loads when TRUST_CONFIG is disabled."""
+    monkeypatch.setattr(env, "TRUST_CONFIG", False)
+    config = BaseAssetConfig.from_file(io_file)
+    config.inputs[0].args["pandas_options"]["sep"] = ","
+    config.context["nested"]["a"] = 2
+
+    reloaded = BaseAssetConfig.from_file(io_file)
+    assert reloaded.inputs[0].args["pandas_options"] == {"sep": ";"}
+    assert reloaded.context == {"nested": {"a": 1}}
+
+
+def test_from_file_edit_replaces_cached_entries(monkeypatch, io_file):
+    """Test that editing a config file replaces its cached entries instead of accumulating them."""
+    monkeypatch.setattr(env, "TRUST_CONFIG", True)
+    BaseAssetConfig.from_file(io_file)
+    BaseAssetConfig.from_file(io_file)
+
+    with open(io_file, "a") as f:
+        f.write("  edited: true\n")
+    stat_result = os.stat(io_file)
+    os.utime(io_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    assert BaseAssetConfig.from_file(io_file).context == {"nested": {"a": 1}, "edited": True}
+    abs_path, mtime = os.path.abspath(io_file), os.stat(io_file).st_mtime_ns
+    # A single entry per path, now stored for the edited file
+    assert asset._CONFIG_CACHE[abs_path][0][1] == mtime
+    assert asset._VALIDATED_CONFIGS[abs_path][0][1] == mtime
@@ -0,0 +1,160 @@
+import os
+import sys
+import types
+
+import pytest
+
+from soy_cli.utils import loaders
+from soy_cli.utils.loaders import (
+    load_module_from_path,
+    render_config_file,
+    render_configs_with_jinja,
+    safe_load_yamls,
+)
+
+CONFIG_YAML = """
+name: "{{ ENV }}_sales"
+query: |
+  SELECT * FROM {{ ENV }}.orders
+static:
+  path: orders.csv
+  options:
+    sep: ";"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a sample templated config and return its path."""
+    path = tmp_path / "io.yaml"
+    path.write_text(CONFIG_YAML)
+    return str(path)
+
+
+def test_render_nested_dicts_and_lists():
+    """Test that templated leaves are rendered at any depth while other values are kept."""
+    configs = {"outer": {"items": ["{{ ENV }}_a", 1, {"inner": "{{ ENV }}_b"}], "flag": True}}
+    assert render_configs_with_jinja(configs, {"ENV": "dev"}) == {
+        "outer": {"items": ["dev_a", 1, {"inner": "dev_b"}], "flag": True}}
+
+
+def test_render_templated_keys():
+    """Test that mapping keys are rendered like values, keeping the order of the items."""
+    configs = {"first": 1, "{{ ENV }}_table": 2, "last": 3}
+    rendered = render_configs_with_jinja(configs, {"ENV": "dev"})
+    assert list(rendered.items()) == [("first", 1), ("dev_table", 2), ("last", 3)]
+
+
+def test_render_shares_static_subtrees():
+    """Test that rendering copies only the containers holding a templated value."""
+    configs = {"name": "{{ ENV }}", "static": {"options": {"sep": ";"}}, "columns": ["a", "b"]}
+    rendered = render_configs_with_jinja(configs, {"ENV": "dev"})
+    assert rendered is not configs
+    assert rendered["static"] is configs["static"]
+    assert rendered["columns"] is configs["columns"]
+
+    static_configs = {"static": {"options": {"sep": ";"}}}
+    assert render_configs_with_jinja(static_configs, {"ENV": "dev"}) is static_configs
+
+
+def test_render_does_not_escape_html():
+    """Test that rendered values are not HTML-escaped."""
+    assert render_configs_with_jinja({"query": "{{ FILTER }}"}, {"FILTER": "a < 1 & b > 'x'"}) == {
+        "query": "a < 1 & b > 'x'"}
+
+
+def test_render_undefined_variable_raises_value_error():
+    """Test that a variable missing from vars_to_render raises a ValueError, in dicts and in strings."""
+    with pytest.raises(ValueError, match="Missing variable"):
+        render_configs_with_jinja({"nested": ["{{ MISSING }}"]}, {})
+    with pytest.raises(ValueError, match="Missing variable"):
+        render_configs_with_jinja("{{ MISSING }}", {})
+
+
+def test_render_config_file_keeps_block_scalar_newline(config_file):
+    """Test that a rendered file gives the same values as rendering the whole YAML document."""
+    rendered = render_config_file(config_file, {"ENV": "dev"})
+    assert rendered["name"] == "dev_sales"
+    assert rendered["query"] == "SELECT * FROM dev.orders\n"
+
+
+def test_render_config_file_reuses_parsed_file(config_file):
+    """Test that an unchanged file is parsed once and rendered again with the new variables."""
+    assert render_config_file(config_file, {"ENV": "dev"})["name"] == "dev_sales"
+    parsed = loaders._PARSED_CONFIG_CACHE[os.path.abspath(config_file)][1]
+
+    rendered = render_config_file(config_file, {"ENV": "prod"})
+    assert rendered["name"] == "prod_sales"
+    assert rendered["static"] is parsed["static"]
+
+
+@pytest.fixture
+def module_file(tmp_path, monkeypatch):
+    """Write a sample module, returning its name and path; its sys.modules entry is removed afterwards."""
+    monkeypatch.delitem(sys.modules, "sample_asset", raising=False)
+    path = tmp_path / "main.py"
+    path.write_text("VALUE = 1\n")
+    return "sample_asset", str(path)
+
+
+def test_load_module_reuses_unchanged_module(module_file):
+    """Test that loading an unchanged file again returns the executed module, still registered."""
+    module = load_module_from_path(*module_file)
+    del sys.modules["sample_asset"]
+
+    assert load_module_from_path(*module_file) is module
+    assert sys.modules["sample_asset"] is module
+
+
+def test_load_module_executes_modified_file_again(module_file):
+    """Test that a modified file is executed again and replaces its cached module."""
+    name, path = module_file
+    module = load_module_from_path(name, path)
+
+    with open(path, "w") as f:
+        f.write("VALUE = 2\n")
+    stat_result = os.stat(path)
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_module_from_path(name, path)
+    assert reloaded is not module
+    assert reloaded.VALUE == 2
+    assert loaders._MODULE_CACHE[(name, path)] == (os.stat(path).st_mtime_ns, reloaded)
+
+
+def test_load_module_unregistered_restores_previous_entry(module_file):
+    """Test that register=False restores the previous sys.modules entry and skips the module cache."""
+    name, path = module_file
+    previous = sys.modules[name] = types.ModuleType(name)
+
+    module = load_module_from_path(name, path, register=False)
+    assert module.VALUE == 1
+    assert sys.modules[name] is previous
+    assert (name, path) not in loaders._MODULE_CACHE
+
+
+def test_load_module_unregistered_without_previous_entry(module_file):
+    """Test that register=False leaves no sys.modules entry when there was none before."""
+    name, path = module_file
+    load_module_from_path(name, path, register=False)
+    assert name not in sys.modules
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_safe_load_yamls_keeps_order(tmp_path, count):
+    """Test that safe_load_yamls returns each file's data in the order of the paths, with or without a pool."""
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"config_{index}.yaml"
+        path.write_text(f"index: {index}\n")
+        paths.append(str(path))
+
+    assert safe_load_yamls(paths) == [{"index": index} for index in range(count)]
+
+
+def test_safe_load_yamls_raises_missing_file(tmp_path):
+    """Test that a missing file among several raises FileNotFoundError."""
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\n")
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        safe_load_yamls([str(path), str(tmp_path / "missing.yaml")])
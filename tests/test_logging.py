@@ -86,6 +86,9 @@ def test_string_interpolation_invalid_format(capfd):
         "Found %r in data",
         "Character: %c",
         "Multiple %s and %d patterns",
+        "Ratio is %e",
+        "Total: %G units",
+        "Ascii %a value",
     ],
 )
 def test_logger_with_old_interpolation_patterns(msg_pattern):
@@ -190,3 +193,23 @@ def test_logger_new_context_propagation(capfd):
     assert parsed["session_id"] == "abc123"
     assert parsed["action"] == "login"
     assert parsed["event"] == "User action"
+
+
+def test_is_enabled_for_follows_configured_level():
+    """Test that isEnabledFor reflects the configured minimum log level."""
+    soy_cli_logging.configure_logging(use_json=True, log_level="WARNING")
+    logger = soy_cli_logging.getLogger(__name__)
+    assert not logger.isEnabledFor(soy_cli_logging.DEBUG)
+    assert not logger.isEnabledFor("info")
+    assert logger.isEnabledFor(soy_cli_logging.WARNING)
+    assert logger.isEnabledFor("error")
+
+
+def test_configure_logging_skips_identical_reconfiguration():
+    """Test that repeating the same configuration keeps cached loggers, and a new one resets them."""
+    soy_cli_logging.configure_logging(use_json=True, log_level="DEBUG")
+    logger = soy_cli_logging.getLogger(__name__)
+    soy_cli_logging.configure_logging(use_json=True, log_level="DEBUG")
+    assert soy_cli_logging.getLogger(__name__) is logger
+    soy_cli_logging.configure_logging(use_json=True, log_level="INFO")
+    assert soy_cli_logging.getLogger(__name__) is not logger
@@ -0,0 +1,93 @@
+import itertools
+import json
+
+import pytest
+
+import soy_cli.logging as soy_cli_logging
+from soy_cli.config.env import env
+from soy_cli.utils import measure
+from soy_cli.utils.measure import timing_decorator
+
+
+def get_log_records(capfd) -> list[dict]:
+    """Parse the JSON log lines captured on stdout or stderr."""
+    captured = capfd.readouterr()
+    lines = (captured.out + captured.err).strip().splitlines()
+    return [json.loads(line) for line in lines if line.startswith("{")]
+
+
+@timing_decorator
+def add(a, b=0):
+    """Add two numbers."""
+    return a + b
+
+
+@timing_decorator
+def fail(a):
+    """Raise an error."""
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def log_level(request, monkeypatch):
+    """Configure JSON logging at the level given by the test parameter."""
+    soy_cli_logging.configure_logging(use_json=True, log_level=request.param)
+    # structlog caches loggers on first use, take a logger built with the new configuration
+    monkeypatch.setattr(measure, "logger", soy_cli_logging.getLogger(measure.__name__))
+    return request.param
+
+
+@pytest.mark.parametrize("log_level", ["INFO"], indirect=True)
+def test_timing_skipped_when_debug_disabled(capfd, monkeypatch, log_level):
+    """Test that nothing is measured nor logged for a successful call when DEBUG is disabled."""
+    monkeypatch.setattr(measure.time, "perf_counter_ns", lambda: pytest.fail("timing should be skipped"))
+    assert add(1, b=2) == 3
+    assert get_log_records(capfd) == []
+
+
+@pytest.mark.parametrize("log_level", ["INFO"], indirect=True)
+def test_failure_logged_when_debug_disabled(capfd, log_level):
+    """Test that a failure is still logged, without timing, when DEBUG is disabled."""
+    with pytest.raises(RuntimeError, match="boom"):
+        fail(1)
+    (record,) = get_log_records(capfd)
+    assert record["event"] == "Failed to execute function"
+    assert record["level"] == "error"
+    assert "execution_time" not in record
+    assert record["exception"][0]["exc_value"] == "boom"
+
+
+@pytest.mark.parametrize("log_level", ["DEBUG"], indirect=True)
+def test_timing_logged_with_perf_counter(capfd, monkeypatch, log_level):
+    """Test that the execution time is measured with perf_counter_ns and logged in seconds."""
+    monkeypatch.setattr(measure.time, "perf_counter_ns", itertools.count(1_000_000_000, 2_500_000_000).__next__)
+    assert add(1, b=2) == 3
+    (record,) = get_log_records(capfd)
+    assert record["event"] == "Completed function 2.5"
+    assert record["execution_time"] == 2.5
+
+
+@pytest.mark.parametrize("log_level", ["DEBUG"], indirect=True)
+def test_failure_logged_with_timing(capfd, monkeypatch, log_level):
+    """Test that a failure is logged with its execution time when DEBUG is enabled."""
+    monkeypatch.setattr(measure.time, "perf_counter_ns", itertools.count(0, 500_000_000).__next__)
+    with pytest.raises(RuntimeError, match="boom"):
+        fail(1)
+    (record,) = get_log_records(capfd)
+    assert record["event"] == "Failed to execute function"
+    assert record["execution_time"] == 0.5
+
+
+@pytest.mark.parametrize("log_level", ["DEBUG"], indirect=True)
+@pytest.mark.parametrize("log_func_args", [False, True])
+def test_call_arguments_logged_only_when_enabled(capfd, monkeypatch, log_level, log_func_args):
+    """Test that call arguments are only logged when LOG_FUNC_ARGS is enabled."""
+    monkeypatch.setattr(env, "LOG_FUNC_ARGS", log_func_args)
+    add(1, b=2)
+    (record,) = get_log_records(capfd)
+    if log_func_args:
+        assert record["func_args"] == [1]
+        assert record["func_kwargs"] == {"b": 2}
+    else:
+        assert "func_args" not in record
+        assert "func_kwargs" not in record
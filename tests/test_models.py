@@ -0,0 +1,36 @@
+from soy_cli.common.models import InputModel, OutputModel
+
+
+def test_prepared_args_splits_options():
+    """Test that prepared_args separates call arguments from the nested options."""
+    model = InputModel(name="table", args={"path": "a.csv", "pandas_options": {"sep": ";"}})
+    assert model.prepared_args("pandas_options") == ({"path": "a.csv"}, {"sep": ";"})
+
+
+def test_prepared_args_follow_args_changes():
+    """Test that prepared_args follows args replaced on the model or on a copy."""
+    model = OutputModel(name="table", args={"path": "a.csv"})
+    assert model.prepared_args("options") == ({"path": "a.csv"}, {})
+
+    copied = model.model_copy(update={"args": {"path": "b.csv"}})
+    assert copied.prepared_args("options") == ({"path": "b.csv"}, {})
+    assert model.prepared_args("options") == ({"path": "a.csv"}, {})
+
+    model.args = {"path": "c.csv"}
+    assert model.prepared_args("options") == ({"path": "c.csv"}, {})
+
+
+def test_prepared_args_follow_in_place_args_changes():
+    """Test that prepared_args reflects args edited in place after a first call."""
+    model = InputModel(name="table", args={"path": "a.csv", "options": {"x": 1}})
+    assert model.prepared_args("options") == ({"path": "a.csv"}, {"x": 1})
+
+    model.args["path"] = "b.csv"
+    model.args["options"]["x"] = 2
+    assert model.prepared_args("options") == ({"path": "b.csv"}, {"x": 2})
+
+
+def test_single_column_is_normalized_to_a_list():
+    """Test that a single column name (or nothing) is accepted in place of a list."""
+    assert InputModel(name="table", columns="col_a").columns == ["col_a"]
+    assert OutputModel(name="table", columns=None).columns == []
@@ -0,0 +1,54 @@
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from soy_cli.common import reader
+from soy_cli.common.reader import InputManager, ReaderStrategy
+
+
+class _SlowReaderStrategy(ReaderStrategy):
+    """Reader returning the input name, slow enough for concurrent reads to overlap."""
+
+    def read(self, input_config, columns=None, **kwargs):
+        time.sleep(0.05)
+        return input_config.name
+
+
+def test_read_many_reads_every_input_with_one_strategy_instance():
+    """Test that read_many returns each input under its key and creates a shared strategy only once."""
+    created = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            created.append(1)
+        time.sleep(0.05)
+        return _SlowReaderStrategy()
+
+    manager = InputManager({f"input_{i}": {"name": f"table_{i}", "strategy": "slow"} for i in range(4)})
+    manager.add_strategy("slow", factory)
+
+    result = manager.read_many(manager.keys())
+
+    assert result == {f"input_{i}": f"table_{i}" for i in range(4)}
+    assert len(created) == 1
+
+
+def test_spark_session_is_bootstrapped_once_under_concurrency(monkeypatch):
+    """Test that concurrent first calls to _get_spark_session share a single session bootstrap."""
+    calls = []
+
+    @functools.lru_cache(maxsize=1)
+    def create_session():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(reader, "_create_spark_session", create_session)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(lambda _: reader._get_spark_session(), range(4)))
+
+    assert len(calls) == 1
+    assert all(session is sessions[0] for session in sessions)